@@ -7,16 +7,21 @@ Output format: "#0,CIGAR"
 """
 import re
 
-# Pattern: "Day 123, Mon DD YYYY: WORD"
-pattern = r'Day\s+(\d+),.*:\s+(\w+)'
+# Pattern: "Day 123, Mon DD YYYY: WORD" - compiled once instead of per line
+PATTERN = re.compile(r'Day\s+(\d+),.*:\s+(\w+)')
 
 with open('wordle-words-unedited.txt', 'r') as infile:
     with open('wordle-words-complete.csv', 'w') as outfile:
+        lines = []
         for line in infile:
-            match = re.search(pattern, line)
+            # Cheap substring check rejects non-matching lines before the regex
+            if 'Day ' not in line:
+                continue
+            match = PATTERN.search(line)
             if match:
                 day_num = match.group(1)
                 word = match.group(2).upper()
-                outfile.write(f'#{day_num},{word}\n')
+                lines.append(f'#{day_num},{word}\n')
+        outfile.writelines(lines)
 
 print("Conversion complete! Output written to wordle-words-complete.csv")
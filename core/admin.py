@@ -1,9 +1,64 @@
+from datetime import timedelta
+
 from django.contrib import admin
-from django.db.models import Avg, Count, Sum
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import (
+    Avg, BooleanField, Case, CharField, Count, FloatField, IntegerField,
+    OuterRef, Subquery, Sum, Value, When
+)
+from django.db.models.functions import Cast, Concat
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from .models import User, WordleWord, Score, UserStatsCache
 
 
+def _guess_color(guesses):
+    """Color for a guess count: green = great, orange = ok, red = bad/DNF"""
+    if guesses <= 3:
+        return 'green'
+    if guesses <= 5:
+        return 'orange'
+    return 'red'
+
+
+# All seven possible score snippets, rendered once at import time so the
+# changelist doesn't re-run format_html per row
+_GUESS_HTML = {
+    i: mark_safe(f'<span style="color: {_guess_color(i)};">{"DNF" if i == 7 else i}</span>')
+    for i in range(1, 8)
+}
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that skips the full COUNT(*) on large tables.
+
+    On PostgreSQL, an unfiltered changelist uses the planner's row
+    estimate from pg_class when it exceeds the threshold. Filtered or
+    small result sets still get an exact count.
+    """
+    count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        if connection.vendor == 'postgresql' and not self.object_list.query.where:
+            # regclass resolves through the search_path, so the right
+            # table is found even when the name exists in several schemas
+            table = connection.ops.quote_name(self.object_list.model._meta.db_table)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.count_threshold:
+                return row[0]
+        return super().count
+
+
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     """Admin interface for User model"""
@@ -16,16 +71,30 @@ class UserAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Annotate queryset with stats for sorting"""
         queryset = super().get_queryset(request)
+        # Grouped subqueries instead of joined aggregates: each one stays
+        # O(users) and adding another annotated relation later can't
+        # multiply the joined rows and skew Sum/Avg.
+        scores = Score.objects.filter(user=OuterRef('pk')).order_by().values('user')
         queryset = queryset.annotate(
-            num_games=Count('scores'),
-            sum_guesses=Sum('scores__guesses'),
-            avg_score=Avg('scores__guesses')
+            num_games=Subquery(
+                scores.annotate(c=Count('id')).values('c'),
+                output_field=IntegerField()
+            ),
+            sum_guesses=Subquery(
+                scores.annotate(s=Sum('guesses')).values('s'),
+                output_field=IntegerField()
+            ),
+            avg_score=Subquery(
+                scores.annotate(a=Avg('guesses')).values('a'),
+                output_field=FloatField()
+            )
         )
-        return queryset
+        # Only the columns the changelist renders
+        return queryset.only('name', 'email', 'created_at')
 
     def total_games(self, obj):
         """Display total games played by user"""
-        return obj.num_games
+        return obj.num_games or 0
     total_games.short_description = 'Games Played'
     total_games.admin_order_field = 'num_games'
 
@@ -57,15 +126,24 @@ class WordleWordAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Annotate queryset with average score for sorting"""
         queryset = super().get_queryset(request)
+        # Same grouped-subquery pattern as UserAdmin - see the note there.
+        scores = Score.objects.filter(wordle_word=OuterRef('pk')).order_by().values('wordle_word')
         queryset = queryset.annotate(
-            avg_score=Avg('scores__guesses'),
-            num_players=Count('scores')
+            avg_score=Subquery(
+                scores.annotate(a=Avg('guesses')).values('a'),
+                output_field=FloatField()
+            ),
+            num_players=Subquery(
+                scores.annotate(c=Count('id')).values('c'),
+                output_field=IntegerField()
+            )
         )
-        return queryset
+        # Only the columns the changelist renders
+        return queryset.only('wordle_number', 'game_date', 'word')
 
     def players_count(self, obj):
         """Display how many users played this puzzle"""
-        return obj.num_players
+        return obj.num_players or 0
     players_count.short_description = 'Players'
     players_count.admin_order_field = 'num_players'
 
@@ -83,11 +161,23 @@ class ScoreAdmin(admin.ModelAdmin):
     """Admin interface for Score model"""
     list_display = ('display_user', 'display_puzzle', 'guesses_display', 'created_at')
     list_filter = ('guesses', 'created_at', 'user')
+    list_select_related = ('user', 'wordle_word')
+    paginator = EstimatedCountPaginator
     search_fields = ('user__name', 'user__email', 'wordle_word__word')
     readonly_fields = ('id', 'created_at', 'user', 'wordle_word', 'guesses')
     ordering = ('-created_at',)
     date_hierarchy = 'created_at'
 
+    def get_queryset(self, request):
+        """Fetch only the columns rendered by the changelist and __str__"""
+        queryset = super().get_queryset(request)
+        return queryset.only(
+            'guesses', 'created_at',
+            'user__name', 'user__email',
+            'wordle_word__wordle_number', 'wordle_word__game_date',
+            'wordle_word__word'
+        )
+
     def display_user(self, obj):
         """Display user name"""
         return obj.user.name
@@ -102,14 +192,7 @@ class ScoreAdmin(admin.ModelAdmin):
 
     def guesses_display(self, obj):
         """Display guesses with color coding"""
-        if obj.guesses == 7:
-            return format_html('<span style="color: red;">DNF</span>')
-        elif obj.guesses <= 3:
-            return format_html('<span style="color: green;">{}</span>', obj.guesses)
-        elif obj.guesses <= 5:
-            return format_html('<span style="color: orange;">{}</span>', obj.guesses)
-        else:
-            return format_html('<span style="color: red;">{}</span>', obj.guesses)
+        return _GUESS_HTML.get(obj.guesses, obj.guesses)
     guesses_display.short_description = 'Score'
     guesses_display.admin_order_field = 'guesses'
 
@@ -135,10 +218,58 @@ class UserStatsCacheAdmin(admin.ModelAdmin):
     list_display = ('user_name', 'period_display', 'games_played', 'average_guesses',
                    'is_winner', 'cache_status', 'last_updated')
     list_filter = ('period_type', 'is_winner', 'last_updated')
+    list_select_related = ('user',)
+    paginator = EstimatedCountPaginator
     search_fields = ('user__name', 'user__email')
     readonly_fields = ('id', 'last_updated', 'distribution_display')
     ordering = ('-last_updated',)
 
+    def get_queryset(self, request):
+        """Annotate staleness and the period label so neither needs per-row
+        Python work on changelist render"""
+        queryset = super().get_queryset(request)
+        # Mirrors UserStatsCache.cache_is_stale, evaluated in SQL
+        now = timezone.now()
+        queryset = queryset.annotate(
+            is_stale=Case(
+                When(period_type='all_time',
+                     last_updated__lt=now - timedelta(days=7), then=True),
+                When(period_year=now.year,
+                     last_updated__lt=now - timedelta(days=1), then=True),
+                default=False,
+                output_field=BooleanField()
+            )
+        )
+
+        # Period label ("Week 2024 W5", "All Time", ...) built in SQL
+        label = Case(
+            When(period_type='week', then=Value('Week')),
+            When(period_type='month', then=Value('Month')),
+            When(period_type='year', then=Value('Year')),
+            default=Value('All Time'),
+            output_field=CharField()
+        )
+        year_part = Case(
+            When(period_year__isnull=False,
+                 then=Concat(Value(' '), Cast('period_year', CharField()))),
+            default=Value(''),
+            output_field=CharField()
+        )
+        value_part = Case(
+            When(period_type='week', period_year__isnull=False,
+                 period_value__isnull=False,
+                 then=Concat(Value(' W'), Cast('period_value', CharField()))),
+            When(period_type='month', period_year__isnull=False,
+                 period_value__isnull=False,
+                 then=Concat(Value(' M'), Cast('period_value', CharField()))),
+            default=Value(''),
+            output_field=CharField()
+        )
+        queryset = queryset.annotate(
+            period_str=Concat(label, year_part, value_part, output_field=CharField())
+        )
+        return queryset
+
     def user_name(self, obj):
         """Display user name"""
         return obj.user.name
@@ -147,46 +278,47 @@ class UserStatsCacheAdmin(admin.ModelAdmin):
 
     def period_display(self, obj):
         """Display formatted period"""
-        period = obj.period_type.title()
-        if obj.period_year:
-            period += f" {obj.period_year}"
-            if obj.period_value:
-                if obj.period_type == 'week':
-                    period += f" W{obj.period_value}"
-                elif obj.period_type == 'month':
-                    period += f" M{obj.period_value}"
-        return period
+        return obj.period_str
     period_display.short_description = 'Period'
+    period_display.admin_order_field = 'period_str'
 
     def cache_status(self, obj):
         """Display cache freshness status"""
-        if obj.cache_is_stale:
+        if obj.is_stale:
             return format_html('<span style="color: red;">Stale</span>')
         else:
             return format_html('<span style="color: green;">Fresh</span>')
     cache_status.short_description = 'Cache Status'
+    cache_status.admin_order_field = 'is_stale'
 
     def distribution_display(self, obj):
         """Display guess distribution in a readable format"""
         if not obj.distribution:
             return "No data"
 
-        html = "<table style='border-collapse: collapse;'>"
-        html += "<tr><th style='padding: 5px; border: 1px solid #ddd;'>Guesses</th>"
-        html += "<th style='padding: 5px; border: 1px solid #ddd;'>Count</th></tr>"
-
-        for guesses in range(1, 8):
-            count = obj.distribution.get(str(guesses), 0)
-            if count > 0:
-                html += f"<tr><td style='padding: 5px; border: 1px solid #ddd;'>"
-                if guesses == 7:
-                    html += "DNF"
-                else:
-                    html += str(guesses)
-                html += f"</td><td style='padding: 5px; border: 1px solid #ddd;'>{count}</td></tr>"
-
-        html += "</table>"
-        return format_html(html)
+        # Build the markup in a list and join once - cheaper than repeated
+        # string concatenation, and mark_safe avoids re-walking the result.
+        parts = ["<table style='border-collapse: collapse;'>"]
+        parts.append("<tr><th style='padding: 5px; border: 1px solid #ddd;'>Guesses</th>")
+        parts.append("<th style='padding: 5px; border: 1px solid #ddd;'>Count</th></tr>")
+
+        # Iterate only the keys present instead of probing all seven buckets;
+        # ignore non-numeric keys (distribution is hand-editable JSON)
+        items = [
+            (int(key), count) for key, count in obj.distribution.items()
+            if str(key).isdigit()
+        ]
+        for guesses, count in sorted(items):
+            if count <= 0:
+                continue
+            label = "DNF" if guesses == 7 else guesses
+            parts.append(
+                f"<tr><td style='padding: 5px; border: 1px solid #ddd;'>{label}</td>"
+                f"<td style='padding: 5px; border: 1px solid #ddd;'>{count}</td></tr>"
+            )
+
+        parts.append("</table>")
+        return mark_safe(''.join(parts))
     distribution_display.short_description = 'Guess Distribution'
 
     def has_delete_permission(self, request, obj=None):
@@ -1,7 +1,8 @@
 import csv
 from datetime import date, timedelta
 from django.core.management.base import BaseCommand
-from core.models import User, WordleWord, Score
+from django.db import connection, transaction
+from core.models import User, WordleWord, Score, bump_score_version
 
 
 # Wordle puzzle #0 started on June 19, 2021
@@ -32,6 +33,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Only import scores (assumes words and users exist)'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of Score rows per bulk INSERT'
+        )
 
     def handle(self, *args, **options):
         words_file = options['words_file']
@@ -43,7 +50,7 @@ class Command(BaseCommand):
             self.import_words(words_file)
 
         if not words_only:
-            self.import_users_and_scores(stats_file)
+            self.import_users_and_scores(stats_file, options['batch_size'])
 
         self.stdout.write(self.style.SUCCESS('Import complete!'))
 
@@ -51,9 +58,9 @@ class Command(BaseCommand):
         """Import Wordle words from CSV"""
         self.stdout.write(f'Importing words from {filepath}...')
 
-        created_count = 0
-        skipped_count = 0
         seen_numbers = {}
+        to_create = []
+        words_before = WordleWord.objects.count()
 
         with open(filepath, 'r') as f:
             reader = csv.reader(f)
@@ -89,121 +96,159 @@ class Command(BaseCommand):
                 # Calculate date from puzzle number
                 game_date = WORDLE_EPOCH + timedelta(days=puzzle_number)
 
-                # Create or get the WordleWord
-                wordle_word, created = WordleWord.objects.get_or_create(
+                to_create.append(WordleWord(
                     wordle_number=puzzle_number,
-                    defaults={
-                        'game_date': game_date,
-                        'word': word
-                    }
-                )
+                    game_date=game_date,
+                    word=word
+                ))
+
+        # One bulk INSERT instead of a get_or_create round trip per row;
+        # existing puzzle numbers are dropped by the unique constraint
+        if to_create:
+            WordleWord.objects.bulk_create(
+                to_create, batch_size=2000, ignore_conflicts=True
+            )
 
-                if created:
-                    created_count += 1
-                else:
-                    skipped_count += 1
+        created_count = WordleWord.objects.count() - words_before
+        skipped_count = len(to_create) - created_count
 
         self.stdout.write(
             f'Words: {created_count} created, {skipped_count} already existed'
         )
 
-    def import_users_and_scores(self, filepath):
+    @transaction.atomic
+    def import_users_and_scores(self, filepath, batch_size=1000):
         """Import users and scores from stats CSV"""
         self.stdout.write(f'Importing users and scores from {filepath}...')
 
-        users_created = 0
-        scores_created = 0
-        scores_skipped = 0
+        # One transaction for the whole import amortizes the commit cost
+        # across every batch. On PostgreSQL, also defer constraint checks
+        # (for any DEFERRABLE constraints) until commit.
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET CONSTRAINTS ALL DEFERRED')
+
         errors = 0
 
-        # Known player names (used to distinguish DATE rows from player rows)
+        # First streaming pass: collect player names so missing users can be
+        # created in one bulk INSERT, without holding the whole sheet in memory
         player_names = set()
-        users_cache = {}
-
         with open(filepath, 'r') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
+            for row in csv.reader(f):
+                if row and row[0].strip() and row[0].strip() != 'DATE':
+                    player_names.add(row[0].strip())
+        users_cache = {u.name: u for u in User.objects.filter(name__in=player_names)}
+        missing_names = sorted(player_names - users_cache.keys())
+        if missing_names:
+            User.objects.bulk_create(
+                [
+                    User(name=name, email=f'{name.lower()}@example.com')
+                    for name in missing_names
+                ],
+                ignore_conflicts=True
+            )
+            users_cache.update({
+                u.name: u for u in User.objects.filter(name__in=missing_names)
+            })
+        users_created = len(missing_names)
+
+        # Buffer new Score rows and flush in batches. ignore_conflicts lets
+        # the unique_user_puzzle constraint silently drop re-imported cells,
+        # replacing a SELECT+INSERT round trip per cell. (bulk_create skips
+        # Score.save()'s immutability check, which is fine for fresh rows.)
+        scores_before = Score.objects.count()
+        scores_buffered = 0
+        score_batch = []
 
         current_dates = []
+        words_by_date = {}
 
-        for row in rows:
-            if not row or not row[0].strip():
-                continue
-
-            first_cell = row[0].strip()
-
-            # Check if this is a DATE header row
-            if first_cell == 'DATE':
-                # Parse the dates (DD/MM/YYYY format)
-                current_dates = []
-                for i in range(1, len(row)):
-                    date_str = row[i].strip()
-                    if date_str:
-                        try:
-                            day, month, year = date_str.split('/')
-                            current_dates.append(date(int(year), int(month), int(day)))
-                        except (ValueError, IndexError):
-                            current_dates.append(None)
-                    else:
-                        current_dates.append(None)
-                continue
-
-            # This should be a player row
-            player_name = first_cell
-
-            if player_name not in player_names:
-                player_names.add(player_name)
-                # Create user if not exists
-                user, created = User.objects.get_or_create(
-                    name=player_name,
-                    defaults={'email': f'{player_name.lower()}@example.com'}
-                )
-                users_cache[player_name] = user
-                if created:
-                    users_created += 1
-
-            user = users_cache.get(player_name)
-            if not user:
-                user = User.objects.get(name=player_name)
-                users_cache[player_name] = user
-
-            # Parse scores for each date
-            for i, score_str in enumerate(row[1:], start=0):
-                if i >= len(current_dates) or current_dates[i] is None:
-                    continue
-
-                score_str = score_str.strip()
-                if not score_str:
-                    continue
-
-                try:
-                    guesses = int(score_str)
-                except ValueError:
+        # Second streaming pass: iterate the reader directly so memory stays
+        # O(row) regardless of sheet size
+        with open(filepath, 'r') as f:
+            for row in csv.reader(f):
+                if not row or not row[0].strip():
                     continue
 
-                game_date = current_dates[i]
+                first_cell = row[0].strip()
+
+                # Check if this is a DATE header row
+                if first_cell == 'DATE':
+                    # Parse the dates (DD/MM/YYYY format)
+                    current_dates = []
+                    for i in range(1, len(row)):
+                        date_str = row[i].strip()
+                        if date_str:
+                            try:
+                                day, month, year = date_str.split('/')
+                                current_dates.append(date(int(year), int(month), int(day)))
+                            except (ValueError, IndexError):
+                                current_dates.append(None)
+                        else:
+                            current_dates.append(None)
 
-                # Find the WordleWord for this date
-                try:
-                    wordle_word = WordleWord.objects.get(game_date=game_date)
-                except WordleWord.DoesNotExist:
-                    self.stdout.write(self.style.WARNING(
-                        f'No WordleWord found for date {game_date}'
-                    ))
-                    errors += 1
+                    # Prefetch all WordleWords for this header block in one query
+                    # (merging across blocks) instead of one get() per score cell
+                    new_dates = [d for d in current_dates if d and d not in words_by_date]
+                    if new_dates:
+                        words_by_date.update({
+                            w.game_date: w
+                            for w in WordleWord.objects.filter(game_date__in=new_dates)
+                        })
                     continue
 
-                # Create score if not exists
-                score, created = Score.objects.get_or_create(
-                    user=user,
-                    wordle_word=wordle_word,
-                    defaults={'guesses': guesses}
-                )
-
-                if created:
-                    scores_created += 1
-                else:
-                    scores_skipped += 1
+                # This should be a player row
+                player_name = first_cell
+                user = users_cache[player_name]
+
+                # Parse scores for each date
+                for i, score_str in enumerate(row[1:], start=0):
+                    if i >= len(current_dates) or current_dates[i] is None:
+                        continue
+
+                    score_str = score_str.strip()
+                    if not score_str:
+                        continue
+
+                    try:
+                        guesses = int(score_str)
+                    except ValueError:
+                        continue
+
+                    game_date = current_dates[i]
+
+                    # Find the WordleWord for this date
+                    wordle_word = words_by_date.get(game_date)
+                    if wordle_word is None:
+                        self.stdout.write(self.style.WARNING(
+                            f'No WordleWord found for date {game_date}'
+                        ))
+                        errors += 1
+                        continue
+
+                    score_batch.append(
+                        Score(user=user, wordle_word=wordle_word, guesses=guesses)
+                    )
+                    scores_buffered += 1
+
+                    if len(score_batch) >= batch_size:
+                        Score.objects.bulk_create(
+                            score_batch, batch_size=batch_size, ignore_conflicts=True
+                        )
+                        score_batch = []
+
+        if score_batch:
+            Score.objects.bulk_create(
+                score_batch, batch_size=batch_size, ignore_conflicts=True
+            )
+
+        scores_created = Score.objects.count() - scores_before
+        scores_skipped = scores_buffered - scores_created
+
+        # bulk_create skips post_save signals, so invalidate the cached
+        # dashboard explicitly
+        if scores_created:
+            bump_score_version()
 
         self.stdout.write(f'Users: {users_created} created')
         self.stdout.write(
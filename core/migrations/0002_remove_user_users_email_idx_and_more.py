@@ -0,0 +1,35 @@
+# Generated by Django 5.2.17 on 2026-08-31 09:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_email_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='wordleword',
+            name='wordle_words_date_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='wordleword',
+            name='wordle_words_num_idx',
+        ),
+        migrations.AlterField(
+            model_name='wordleword',
+            name='game_date',
+            field=models.DateField(unique=True),
+        ),
+        migrations.AlterField(
+            model_name='wordleword',
+            name='wordle_number',
+            field=models.IntegerField(unique=True),
+        ),
+    ]
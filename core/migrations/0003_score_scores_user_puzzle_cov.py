@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 09:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_remove_user_users_email_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['user', 'wordle_word'], include=('guesses',), name='scores_user_puzzle_cov'),
+        ),
+    ]
@@ -1,5 +1,9 @@
+import threading
 import uuid
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
@@ -16,9 +20,6 @@ class User(models.Model):
 
     class Meta:
         db_table = 'users'
-        indexes = [
-            models.Index(fields=['email'], name='users_email_idx'),
-        ]
 
     def __str__(self):
         return f"{self.name} ({self.email})"
@@ -30,17 +31,15 @@ class WordleWord(models.Model):
     Each record represents a single day's Wordle puzzle.
     """
     id = models.AutoField(primary_key=True)
-    game_date = models.DateField(unique=True, db_index=True)
-    wordle_number = models.IntegerField(unique=True, db_index=True)
+    # unique=True already creates an index usable for lookups, so no
+    # db_index/Meta.indexes duplicates are needed
+    game_date = models.DateField(unique=True)
+    wordle_number = models.IntegerField(unique=True)
     word = models.CharField(max_length=5)
 
     class Meta:
         db_table = 'wordle_words'
         ordering = ['-game_date']
-        indexes = [
-            models.Index(fields=['game_date'], name='wordle_words_date_idx'),
-            models.Index(fields=['wordle_number'], name='wordle_words_num_idx'),
-        ]
 
     def __str__(self):
         return f"Wordle #{self.wordle_number} ({self.game_date}): {self.word}"
@@ -72,6 +71,10 @@ class Score(models.Model):
             models.Index(fields=['user'], name='scores_user_idx'),
             models.Index(fields=['wordle_word'], name='scores_puzzle_idx'),
             models.Index(fields=['guesses'], name='scores_guesses_idx'),
+            # Covering index (PostgreSQL 11+) makes the (user, wordle_word)
+            # lookup used by imports and uniqueness checks index-only
+            models.Index(fields=['user', 'wordle_word'], include=['guesses'],
+                         name='scores_user_puzzle_cov'),
         ]
 
     def __str__(self):
@@ -80,11 +83,34 @@ class Score(models.Model):
 
     def save(self, *args, **kwargs):
         """Enforce immutability - prevent updates after creation"""
-        if self.pk and Score.objects.filter(pk=self.pk).exists():
+        # _state.adding is False once the row has been loaded from the DB,
+        # so no existence query is needed to detect an update
+        if not self._state.adding:
             raise ValueError("Scores cannot be updated once created")
         super().save(*args, **kwargs)
 
 
+def bump_score_version():
+    """
+    Increment the Score-table version counter.
+
+    The dashboard view bakes this number into its cache key, so bumping
+    it invalidates every cached dashboard page. Call it directly after
+    bulk_create(), which does not fire post_save signals.
+    """
+    try:
+        cache.incr('score_version')
+    except ValueError:
+        cache.set('score_version', 1, None)
+
+
+@receiver(post_save, sender=Score)
+@receiver(post_delete, sender=Score)
+def _score_changed(sender, **kwargs):
+    """Keep cached dashboard pages fresh when a Score is saved or deleted"""
+    bump_score_version()
+
+
 class UserStatsCache(models.Model):
     """
     Optional performance optimization table.
@@ -153,15 +179,101 @@ class UserStatsCache(models.Model):
                     period_desc += f" Month {self.period_value}"
         return f"{self.user.name} - {period_desc} stats"
 
+    @classmethod
+    def get_or_refresh(cls, user, period_type='all_time', period_year=None,
+                       period_value=None):
+        """
+        Return the cached stats row for this user and period, kicking off
+        a background refresh if it is stale or missing.
+
+        The caller always gets an immediate answer: a stale row is served
+        as-is while a daemon thread recomputes it, so page latency never
+        includes the recomputation. Returns None when no row exists yet
+        (the refresh will create one for the next request).
+        """
+        entry = cls.objects.filter(
+            user=user,
+            period_type=period_type,
+            period_year=period_year,
+            period_value=period_value
+        ).first()
+
+        if entry is None or entry.cache_is_stale:
+            threading.Thread(
+                target=cls._refresh_in_background,
+                args=(user.pk, period_type, period_year, period_value),
+                daemon=True
+            ).start()
+
+        return entry
+
+    @classmethod
+    def _refresh_in_background(cls, user_id, period_type, period_year,
+                               period_value):
+        """Thread entry point - close this thread's DB connection when done"""
+        from django.db import connection
+        try:
+            cls.refresh(user_id, period_type, period_year, period_value)
+        finally:
+            connection.close()
+
+    @classmethod
+    def refresh(cls, user_id, period_type='all_time', period_year=None,
+                period_value=None):
+        """Recompute and store the stats row for this user and period"""
+        scores = Score.objects.filter(user_id=user_id)
+        if period_year:
+            scores = scores.filter(wordle_word__game_date__year=period_year)
+            if period_value:
+                if period_type == 'week':
+                    scores = scores.filter(wordle_word__game_date__week=period_value)
+                elif period_type == 'month':
+                    scores = scores.filter(wordle_word__game_date__month=period_value)
+
+        solved = models.Q(guesses__lte=6)
+        stats = scores.aggregate(
+            games_played=models.Count('id'),
+            games_solved=models.Count('id', filter=solved),
+            games_failed=models.Count('id', filter=models.Q(guesses=7)),
+            total_guesses=models.Sum('guesses'),
+            average_guesses=models.Avg('guesses', filter=solved),
+            best_score=models.Min('guesses', filter=solved),
+        )
+
+        distribution = {
+            str(row['guesses']): row['count']
+            for row in scores.values('guesses').annotate(count=models.Count('id'))
+        }
+
+        average = stats['average_guesses']
+        entry, _ = cls.objects.update_or_create(
+            user_id=user_id,
+            period_type=period_type,
+            period_year=period_year,
+            period_value=period_value,
+            defaults={
+                'games_played': stats['games_played'],
+                'games_solved': stats['games_solved'],
+                'games_failed': stats['games_failed'],
+                'total_guesses': stats['total_guesses'] or 0,
+                'average_guesses': round(average, 2) if average is not None else None,
+                'best_score': stats['best_score'],
+                'distribution': distribution,
+            }
+        )
+        return entry
+
     @property
     def cache_is_stale(self):
         """Check if cache needs refreshing (older than 24 hours for recent periods)"""
         if self.period_type == 'all_time':
-            # All-time stats can be cached longer
-            return (timezone.now() - self.last_updated).days > 7
+            # All-time stats can be cached longer (threshold matches the
+            # is_stale annotation in UserStatsCacheAdmin.get_queryset)
+            return (timezone.now() - self.last_updated).total_seconds() > 7 * 86400
         elif self.period_year == timezone.now().year:
             # Current year stats should be fresher
-            return (timezone.now() - self.last_updated).hours > 24
+            # (timedelta has no .hours attribute - compare total seconds)
+            return (timezone.now() - self.last_updated).total_seconds() > 86400
         else:
             # Historical stats can be cached indefinitely
             return False
\ No newline at end of file